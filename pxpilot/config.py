@@ -1,31 +1,54 @@
-from typing import Dict, Any
+import os
+from typing import Dict, Any, Tuple
 from typing import Optional
 
 import yaml
 from yaml.parser import ParserError
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from pxpilot.logging_config import LOGGER
 from pxpilot.vm_management.models import AppConfig, HealthCheckOptions, ValidationType, StartupParameters, \
     ProxmoxSettings, AppSettings, VMLaunchSettings
 
+# parsed configs keyed by (path, mtime), so repeated loads within one run skip the YAML parse
+_CACHE: Dict[Tuple[str, int], AppConfig] = {}
+
 
 class ConfigManager:
     def load(self, file_path: str) -> Optional[AppConfig]:
         try:
-            return self.load_internal(file_path)
+            key = (str(file_path), os.stat(file_path).st_mtime_ns)
+        except OSError:
+            key = None
+
+        if key is not None and key in _CACHE:
+            return _CACHE[key]
+
+        try:
+            app_config = self.load_internal(file_path)
         except ParserError as pe:
             error = str(pe.args)
             LOGGER.exception("Failed to parse configuration file: %s", error)
             raise Exception(error)
 
+        if key is not None and app_config is not None:
+            _CACHE[key] = app_config
+
+        return app_config
+
     @staticmethod
     def load_internal(file_path: str) -> Optional[AppConfig]:
         """Load configuration from a YAML file into a ProxmoxConfig object."""
 
         def load_yaml_config(path: str) -> Dict[str, Any]:
             """Helper function to load a YAML configuration file."""
-            with open(path, "r") as file:
-                return yaml.safe_load(file)
+            # binary mode hands raw bytes straight to libyaml, skipping the text decode pass
+            with open(path, "rb") as file:
+                return yaml.load(file, Loader=_YamlLoader)
 
         def parse_healthcheck(healthcheck_data: Dict[str, Any]) -> Optional[HealthCheckOptions]:
             """Parse health check data into a HealthCheckOptions object."""
@@ -43,9 +66,6 @@ class ConfigManager:
                 )
             return StartupParameters()
 
-        def parse_notification_parameters(notification_data: Dict[str, Any]) -> Dict[str, Any]:
-            return notification_data
-
         config_data = load_yaml_config(file_path)
 
         proxmox_config = ProxmoxSettings()
@@ -53,7 +73,8 @@ class ConfigManager:
 
         settings = AppSettings(**config_data.get("settings", {}))
 
-        notification_settings = parse_notification_parameters(config_data.get("notification_options", {}))
+        # notification options are handed to the notifiers as parsed, no copying
+        notification_settings = config_data.get("notification_options", {})
 
         vms = []
         for vm_data in config_data.get("vms", []):
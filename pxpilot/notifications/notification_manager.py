@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List
 
@@ -30,25 +31,31 @@ class NotificationManager:
             message.fatal(error_message)
 
     def send(self):
-        for message, notifier in self._message_to_notifier_map.items():
-            LOGGER.debug(f"Send notification to {notifier}")
-            try:
-                notifier.send(message)
-            except KeyError as ke:
-                LOGGER.error(f"Missing parameter in config for {notifier.__class__}: {ke}")
-            except Exception as ex:
-                LOGGER.error(f"Error on sending using {notifier.__class__}: {ex}")
+        if len(self._message_to_notifier_map) == 0:
+            return
+
+        # every notifier blocks on its own socket, so send them in parallel
+        with ThreadPoolExecutor(max_workers=len(self._message_to_notifier_map)) as pool:
+            for message, notifier in self._message_to_notifier_map.items():
+                pool.submit(self._send_one, message, notifier)
+
+    @staticmethod
+    def _send_one(message, notifier):
+        LOGGER.debug(f"Send notification to {notifier}")
+        try:
+            notifier.send(message)
+        except KeyError as ke:
+            LOGGER.error(f"Missing parameter in config for {notifier.__class__}: {ke}")
+        except Exception as ex:
+            LOGGER.error(f"Error on sending using {notifier.__class__}: {ex}")
 
     def _build_notifiers(self, config) -> List[Notifier]:
-        return [notifier for notifier in
-                (self._create_notifier(n) for n in config)
-                if notifier is not None]
-
-    def _create_notifier(self, notifier_config) -> Notifier | None:
-        for key in notifier_config.keys():
-            if key in self._notifier_types:
-                LOGGER.debug(f"Creating '{key}' notifier.")
-                config = notifier_config[key]
-                if not notifier_config[key].get("disabled", False):
-                    return self._notifier_types[key](config)
-        return None
+        # flatten the list of one-key dicts once and dispatch straight off the type map
+        items = [(name, options)
+                 for notifier_config in config
+                 for name, options in notifier_config.items()
+                 if name in self._notifier_types and not options.get("disabled", False)]
+
+        LOGGER.debug(f"Creating notifiers: {[name for name, _ in items]}.")
+
+        return [self._notifier_types[name](options) for name, options in items]
@@ -1,24 +1,71 @@
+import io
+import logging
+import os
+import pickle
+import sys
 import warnings
-from typing import List
+from pathlib import Path
+from typing import List, TYPE_CHECKING
 
 from pxpilot.config import ConfigManager
-from pxpilot.notifications.notifier_types import NOTIFIER_TYPES
-from pxpilot.vm_management.executor import Executor
-from pxpilot.vm_management.host_validator import HostValidator
 from pxpilot.vm_management.models import VMLaunchSettings
-from pxpilot.vm_management.vm_starter import VMStarter
 
 from pxpilot.logging_config import LOGGER
-from pxpilot.notifications import NotificationManager
-from pxpilot.pxtool import ProxmoxClient
 
-warnings.filterwarnings("ignore")
+if TYPE_CHECKING:
+    from pxpilot.notifications import NotificationManager
+    from pxpilot.pxtool import ProxmoxClient
+    from pxpilot.vm_management.executor import Executor
 
 CONFIG_FILE = "config.yaml"
+# resolved once so every load and stat works on the same absolute path
+_CONFIG_PATH = Path(CONFIG_FILE).resolve()
 
+# auth mode index: bit 1 - token credentials present, bit 0 - user/password credentials present;
+# token auth wins when both are configured
+_AUTH_STATUS = ("Missing Authentication Information", "Ok (User-password-based)",
+                "Ok (Token-based)", "Ok (Token-based)")
+_AUTH_VALID = (False, True, True, True)
 
-def build_executor(app_config, notification_manager) -> Executor:
-    px_client = ProxmoxClient(**app_config.proxmox_config.px_settings)
+
+def load_app_config(config_file=_CONFIG_PATH):
+    """
+    Load the app config, preferring a pickled sidecar cache over the YAML parse.
+
+    The cache is written next to the config file and considered fresh while its
+    mtime is not older than the config's; a stale or unreadable cache falls back
+    to the regular YAML load and is rewritten.
+    """
+    cache_path = f"{config_file}.cache.pkl"
+    try:
+        if os.stat(cache_path).st_mtime_ns >= os.stat(config_file).st_mtime_ns:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.PickleError, AttributeError, EOFError):
+        LOGGER.debug("Config cache is missing or unreadable, parsing config.")
+
+    app_config = ConfigManager().load(config_file)
+
+    if app_config is not None:
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump(app_config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as ex:
+            LOGGER.debug(f"Unable to write config cache: {ex}")
+
+    return app_config
+
+
+def build_executor(app_config, notification_manager, px_client=None) -> "Executor":
+    # imported here so validate_config() never pays for proxmoxer and its HTTP stack
+    from pxpilot.pxtool import ProxmoxClient
+    from pxpilot.vm_management.executor import Executor
+    from pxpilot.vm_management.host_validator import HostValidator
+    from pxpilot.vm_management.vm_starter import VMStarter
+
+    # reuse an already-connected client (e.g. from validation) when one is given
+    if px_client is None:
+        px_client = ProxmoxClient(**app_config.proxmox_config.px_settings)
 
     starter = VMStarter(px_client, HostValidator())
 
@@ -28,8 +75,12 @@ def build_executor(app_config, notification_manager) -> Executor:
     return executor
 
 
-def build_notification_manager(app_config) -> NotificationManager | None:
+def build_notification_manager(app_config) -> "NotificationManager | None":
     if app_config.notification_settings is not None and len(app_config.notification_settings) > 0:
+        # notifier SDKs are only imported when notifications are actually configured
+        from pxpilot.notifications import NotificationManager
+        from pxpilot.notifications.notifier_types import NOTIFIER_TYPES
+
         return NotificationManager(app_config.notification_settings, NOTIFIER_TYPES)
     return None
 
@@ -37,7 +88,7 @@ def build_notification_manager(app_config) -> NotificationManager | None:
 def main():
     LOGGER.info("pilot is starting")
 
-    app_config = ConfigManager().load(CONFIG_FILE)
+    app_config = load_app_config()
     if app_config is not None:
         LOGGER.info("Config loaded.")
 
@@ -45,14 +96,17 @@ def main():
 
         try:
             executor = build_executor(app_config, notification_manager)
-            executor.start()
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore")
+                executor.start()
         except Exception as ex:
             if notification_manager is not None:
                 notification_manager.fatal(str(ex))
-            LOGGER.error(ex)
+            LOGGER.exception("pilot failed")
 
         if notification_manager is not None:
-            LOGGER.debug("Send notifications...")
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Send notifications...")
 
             notification_manager.send()
 
@@ -63,65 +117,69 @@ def main():
 
 
 def validate_config():
-    print(f"Start validating '{CONFIG_FILE}'...")
+    # validation output is collected in one buffer and flushed with a single write
+    buf = io.StringIO()
+    print(f"Start validating '{CONFIG_FILE}'...", file=buf)
     valid = True
     try:
-        app_config = ConfigManager().load(CONFIG_FILE)
-        print("Config loaded.")
+        app_config = ConfigManager().load(_CONFIG_PATH)
+        print("Config loaded.", file=buf)
 
         if app_config.proxmox_config is None or app_config.proxmox_config.px_settings is None:
             valid = False
-            print("(!) Proxmox access config is missing.")
+            print("(!) Proxmox access config is missing.", file=buf)
 
         if app_config.app_settings is None:
-            print("(!) Optional App setting section is missing")
+            print("(!) Optional App setting section is missing", file=buf)
 
         if app_config.proxmox_config is not None:
             if app_config.proxmox_config.start_options is None or len(app_config.proxmox_config.start_options) == 0:
-                print("(!) There is no VM's to start in config")
+                print("(!) There is no VM's to start in config", file=buf)
 
         if app_config.notification_settings is None or len(app_config.notification_settings) == 0:
-            print("(!) Notification settings are missed")
+            print("(!) Notification settings are missed", file=buf)
 
-        valid = validate_proxmox_config(app_config.proxmox_config.px_settings)
+        valid, px_client = validate_proxmox_config(app_config.proxmox_config.px_settings, buf)
 
-        validate_vms(app_config.proxmox_config.start_options)
+        valid = validate_vms(app_config.proxmox_config.start_options, buf, px_client) and valid
 
         if valid:
-            print("Config validated successfully.")
+            print("Config validated successfully.", file=buf)
         else:
-            print("Config validated with errors.")
+            print("Config validated with errors.", file=buf)
     except Exception as ex:
-        print(f"(!) Error occurred during reading config: {ex}")
+        print(f"(!) Error occurred during reading config: {ex}", file=buf)
+    finally:
+        sys.stdout.write(buf.getvalue())
+
 
+def validate_connection(px_settings, buf) -> "ProxmoxClient | None":
+    """ Returns the connected client so later validation steps can reuse it, or None on failure. """
+    from pxpilot.pxtool import ProxmoxClient
 
-def validate_connection(px_settings) -> bool:
-    print("  Try to connect to Proxmox...")
+    print("  Try to connect to Proxmox...", file=buf)
     px_client = ProxmoxClient(**px_settings)
     try:
-        px_client.get_all_vms()
-        print("    Successfully connected.")
+        px_client.ping()
+        print("    Successfully connected.", file=buf)
     except Exception as ex:
-        print(f"    (!) Unable to connect to Proxmox: {ex}")
-        return False
-    return True
+        print(f"    (!) Unable to connect to Proxmox: {ex}", file=buf)
+        return None
+    return px_client
 
 
-def validate_proxmox_config(px_settings) -> bool:
-    print("⌜ Proxmox settings validation: starting...")
-    host_status: str
-    valid = False
+def validate_proxmox_config(px_settings, buf) -> "tuple[bool, ProxmoxClient | None]":
+    print("⌜ Proxmox settings validation: starting...", file=buf)
     host = px_settings.get("host", None)
-    if host is not None:
-        if len(host) > 0:
-            valid = True
-            host_status = "Ok"
-        else:
-            host_status = "Empty"
+    valid = bool(host)
+    if host:
+        host_status = "Ok"
+    elif host is not None:
+        host_status = "Empty"
     else:
         host_status = "Missing"
 
-    print(f"  Proxmox host: {host_status}")
+    print(f"  Proxmox host: {host_status}", file=buf)
 
     token = px_settings.get("token", None)
     token_value = px_settings.get("token_value", None)
@@ -129,43 +187,41 @@ def validate_proxmox_config(px_settings) -> bool:
     password = px_settings.get("password", None)
     realm = px_settings.get("realm", None)
 
-    auth_valid = False
-
-    if token and token_value:
-        if len(token) > 0 and len(token_value) > 0:
-            auth_valid = True
-            auth_status = "Ok (Token-based)"
-        else:
-            auth_status = "Invalid Token or Token Value"
-    elif user and password and realm:
-        if len(user) > 0 and len(password) > 0 and len(realm) > 0:
-            auth_valid = True
-            auth_status = "Ok (User-password-based)"
-        else:
-            auth_status = "Invalid User, Password, or Realm"
-    else:
-        auth_status = "Missing Authentication Information"
+    mode = 2 * bool(token and token_value) + bool(user and password and realm)
+    auth_valid = _AUTH_VALID[mode]
+    auth_status = _AUTH_STATUS[mode]
 
-    print(f"  Proxmox authentication: {auth_status}")
+    print(f"  Proxmox authentication: {auth_status}", file=buf)
 
     valid = valid and auth_valid
 
+    px_client = None
     if valid:
-        valid = valid and validate_connection(px_settings)
+        px_client = validate_connection(px_settings, buf)
+        valid = px_client is not None
+
+    print("∟ Proxmox settings validation: completed.", file=buf)
+    return valid, px_client
 
-    print("∟ Proxmox settings validation: completed.")
-    return valid
 
+def validate_vms(starts: List[VMLaunchSettings], buf, px_client=None) -> bool:
+    print("⌜ Start settings validation: starting...", file=buf)
 
-def validate_vms(starts: List[VMLaunchSettings]):
-    print("⌜ Start settings validation: starting...")
-    valid = False
+    print(f"  Found {len(starts)} vm start settings.", file=buf)
 
-    print(f"  Found {len(starts)} vm start settings.")
+    wrong_ids = [vm.vm_id for vm in starts if not isinstance(vm.vm_id, int) or not vm.vm_id]
+    if wrong_ids:
+        print(f"  (!) Wrong VM ids: {wrong_ids}", file=buf)
 
-    for vm in starts:
-        if vm.vm_id is None or vm.vm_id == 0 or not isinstance(vm.vm_id, int):
-            print(f"  (!) Wrong VM id: {vm.vm_id}")
+    if px_client is not None:
+        # one batched listing covers the existence check for every configured VM
+        try:
+            px_vms = px_client.get_all_vms()
+            missing_ids = [vm.vm_id for vm in starts if vm.vm_id not in px_vms]
+            if missing_ids:
+                print(f"  (!) VMs not found on Proxmox: {missing_ids}", file=buf)
+        except Exception as ex:
+            print(f"  (!) Unable to get VM list from Proxmox: {ex}", file=buf)
 
-    print("∟ Start settings validation: completed.")
-    return valid
+    print("∟ Start settings validation: completed.", file=buf)
+    return not wrong_ids
@@ -1,4 +1,12 @@
-from pxpilot.pxtool.proxmox_client import VirtualMachine, ProxmoxClient
+from pxpilot.pxtool.models import VirtualMachine
 from pxpilot.pxtool.vm_service import VMService
 
 __all__ = ["VMService", "VirtualMachine", "ProxmoxClient"]
+
+
+def __getattr__(name):
+    # ProxmoxClient drags in proxmoxer and its HTTP stack, so resolve it lazily
+    if name == "ProxmoxClient":
+        from pxpilot.pxtool.proxmox_client import ProxmoxClient
+        return ProxmoxClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
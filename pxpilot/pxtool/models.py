@@ -6,6 +6,8 @@ class ProxmoxVMFields:
     VM_ID = "vmid"
     VM_NAME = "name"
     VM_STATUS = "status"
+    VM_TYPE = "type"
+    VM_NODE = "node"
 
 
 class VMType(StrEnum):
@@ -34,7 +36,7 @@ class VMState(StrEnum):
     STOPPED = "stopped"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class VirtualMachine:
     vm_id: int
     vm_type: VMType
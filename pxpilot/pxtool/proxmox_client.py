@@ -1,5 +1,6 @@
 import proxmoxer
 from proxmoxer import ProxmoxAPI, ResourceException
+from requests.adapters import HTTPAdapter
 from requests.exceptions import SSLError
 
 from .models import ProxmoxCommand, VMType, VirtualMachine, VMState
@@ -15,9 +16,14 @@ class ProxmoxClient(VMService):
     _proxmox: ProxmoxAPI
 
     def __init__(self, **kwargs):
-        self._build_client(**kwargs)
+        self._vm_resources = {}
+        self._connection_kwargs = self._parse_credentials(kwargs)
+        self._build_client()
+
+    @staticmethod
+    def _parse_credentials(kwargs) -> dict:
+        """ Normalize the connection settings once so _build_client can be re-run cheaply on reconnect. """
 
-    def _build_client(self, **kwargs) -> None:
         if "token" in kwargs:
             try:
                 user, token_name = kwargs.pop("token").split("!")
@@ -26,8 +32,20 @@ class ProxmoxClient(VMService):
             except ValueError:
                 raise ProxmoxConfigurationError("Configuration problem: error on parsing token. Expected format: 'user@pve!token'.")
 
+        return kwargs
+
+    def _build_client(self) -> None:
+        kwargs = dict(self._connection_kwargs)
+        self._vm_resources.clear()
+
         self._proxmox = proxmoxer.ProxmoxAPI(host=kwargs.pop("host"), **kwargs)
 
+        # reuse keepalive connections across requests instead of paying a TLS
+        # handshake per call; proxmoxer keeps its requests session in _store
+        session = self._proxmox._store.get("session")
+        if session is not None:
+            session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=1))
+
     def start_vm(self, vm: VirtualMachine) -> None:
         """
         Initiates the startup of a specific VM.
@@ -36,60 +54,72 @@ class ProxmoxClient(VMService):
             vm (VirtualMachine): VM to start.
         """
 
-        self._px_post(f"nodes/{vm.node}/{vm.vm_type}/{vm.vm_id}/status/{ProxmoxCommand.START}")
+        self._px_post(self._vm_resource(vm, ProxmoxCommand.START))
 
     def get_vm_status(self, vm: VirtualMachine) -> VMState:
         """ Return current running status of VM """
 
-        status = self._px_get(f"nodes/{vm.node}/{vm.vm_type}/{vm.vm_id}/status/{ProxmoxCommand.CURRENT}")
+        status = self._px_get(self._vm_resource(vm, ProxmoxCommand.CURRENT))
         return VMState(status[ProxmoxVMFields.VM_STATUS])
 
     def get_all_vms(self, node: str | None = None) -> dict[int, VirtualMachine]:
         """
-        Retrieves a list of all VMs from a specified node.
+        Retrieves a list of all VMs in one request via the cluster resources endpoint.
 
         Args:
-            node (str): Node identifier in the Proxmox environment.
+            node (str): Optional node identifier to filter the result by.
 
         Returns:
             Dict[int, VirtualMachine]: Dictionary of VM list.
         """
 
-        def fetch_by_type(vm_type, node_name):
-            return [
-                VirtualMachine(vm_id=int(vm[ProxmoxVMFields.VM_ID]), vm_type=vm_type, name=vm[ProxmoxVMFields.VM_NAME],
-                               status=VMState(vm[ProxmoxVMFields.VM_STATUS]), node=node_name)
-                for vm in self._px_get(f"nodes/{node_name}/{vm_type}")]
-
-        def fetch_all(node_name):
-            result = dict()
-            for lxc in fetch_by_type(VMType.LXC, node_name):
-                result[lxc.vm_id] = lxc
-            for qemu in fetch_by_type(VMType.QEMU, node_name):
-                result[qemu.vm_id] = qemu
-            return result
-
         vms = dict()
-        px_nodes = []
-        if node is None:
-            px_nodes.extend([px_node["node"] for px_node in self._px_get("nodes") if px_node["status"] == "online"])
-        else:
-            px_nodes.append(node)
-
-        for n in px_nodes:
-            vms.update(fetch_all(n))
+        for vm in self._px_get("cluster/resources", type="vm"):
+            if node is not None and vm[ProxmoxVMFields.VM_NODE] != node:
+                continue
+            # VMs on offline nodes are reported with an 'unknown' status, skip them
+            if vm[ProxmoxVMFields.VM_STATUS] not in (VMState.RUNNING, VMState.STOPPED):
+                continue
+
+            vm_id = int(vm[ProxmoxVMFields.VM_ID])
+            vms[vm_id] = VirtualMachine(vm_id=vm_id, vm_type=VMType(vm[ProxmoxVMFields.VM_TYPE]),
+                                        name=vm[ProxmoxVMFields.VM_NAME],
+                                        status=VMState(vm[ProxmoxVMFields.VM_STATUS]),
+                                        node=vm[ProxmoxVMFields.VM_NODE])
 
         return vms
 
     def stop_vm(self, vm: VirtualMachine):
-        self._px_post(f"nodes/{vm.node}/{vm.vm_type}/{vm.vm_id}/status/{ProxmoxCommand.SHUTDOWN}")
+        self._px_post(self._vm_resource(vm, ProxmoxCommand.SHUTDOWN))
+
+    def ping(self) -> None:
+        """
+        Cheap connectivity probe: hits the version endpoint, which returns a few
+        bytes instead of the full VM listing.
+        """
+
+        self._px_get("version")
+
+    def _vm_resource(self, vm: VirtualMachine, command: ProxmoxCommand):
+        """
+        Return the proxmoxer resource for a VM status command, memoized per
+        (node, type, id, command) so polling loops skip re-tokenizing the path.
+        """
+
+        key = (vm.node, vm.vm_type, vm.vm_id, command)
+        resource = self._vm_resources.get(key)
+        if resource is None:
+            resource = self._proxmox(f"nodes/{vm.node}/{vm.vm_type}/{vm.vm_id}/status/{command}")
+            self._vm_resources[key] = resource
+        return resource
 
     @retry(tries=5, delay=5, excludes=(SSLError, ResourceException, ProxmoxError,))
-    def _px_get(self, command):
-        """ Execute GET request using proxmoxer """
+    def _px_get(self, command, **params):
+        """ Execute GET request using proxmoxer; accepts a path or a prepared resource """
 
         try:
-            return self._proxmox(command).get()
+            resource = self._proxmox(command) if isinstance(command, str) else command
+            return resource.get(**params)
         except SSLError:
             raise FatalProxmoxError("An SSL error occurred.")
         except ResourceException as ex:
@@ -97,9 +127,10 @@ class ProxmoxClient(VMService):
 
     @retry(tries=5, delay=5, excludes=(SSLError, ResourceException, ProxmoxError,))
     def _px_post(self, command):
-        """ Execute POST request using proxmoxer """
+        """ Execute POST request using proxmoxer; accepts a path or a prepared resource """
 
         try:
-            return self._proxmox(command).post()
+            resource = self._proxmox(command) if isinstance(command, str) else command
+            return resource.post()
         except ResourceException as ex:
             raise ProxmoxError(ex.content)
@@ -3,7 +3,7 @@ from datetime import datetime
 from enum import Enum, auto
 from typing import Optional, Dict, Any, List
 
-from pxpilot.pxtool import VirtualMachine
+from pxpilot.pxtool.models import VirtualMachine
 
 
 class StartStatus(Enum):
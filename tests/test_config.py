@@ -1,9 +1,11 @@
+import os
 from unittest.mock import patch, mock_open
 
 import pytest
 import yaml
 
 from pxpilot.config import ConfigManager
+from pxpilot.pilot import load_app_config
 from pxpilot.vm_management.models import AppConfig, VMLaunchSettings
 
 HOST_VALUE = "192.168.1.1:8006"
@@ -63,7 +65,7 @@ vms:
 @pytest.fixture
 def mock_file_open():
     with patch("builtins.open", mock_open(read_data=VALID_CONFIG)) as mock_file:
-        with patch("yaml.safe_load", return_value=yaml.safe_load(VALID_CONFIG)) as mock_load:
+        with patch("yaml.load", return_value=yaml.safe_load(VALID_CONFIG)) as mock_load:
             yield mock_file, mock_load
 
 
@@ -86,3 +88,44 @@ def test_load(mock_file_open):
     assert config.app_settings is not None
 
     mock_file_open[1].assert_called_once()
+
+
+def test_load_uses_mtime_cache(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(VALID_CONFIG)
+
+    real_load = yaml.load
+    with patch("yaml.load", side_effect=lambda stream, Loader: real_load(stream, Loader=Loader)) as mock_load:
+        first = ConfigManager().load(config_file)
+        second = ConfigManager().load(config_file)
+
+        assert isinstance(first, AppConfig)
+        assert second is first
+        mock_load.assert_called_once()
+
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        third = ConfigManager().load(config_file)
+
+        assert third is not first
+        assert mock_load.call_count == 2
+
+
+def test_load_app_config_pickle_sidecar(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(VALID_CONFIG)
+    cache_file = tmp_path / "config.yaml.cache.pkl"
+
+    cold = load_app_config(config_file)
+
+    assert isinstance(cold, AppConfig)
+    assert cache_file.exists()
+
+    with patch("pxpilot.pilot.ConfigManager") as mock_manager:
+        warm = load_app_config(config_file)
+        mock_manager.assert_not_called()
+
+    assert isinstance(warm, AppConfig)
+    assert warm.proxmox_config.px_settings == cold.proxmox_config.px_settings
+    assert warm.proxmox_config.start_options == cold.proxmox_config.start_options